@@ -3,7 +3,7 @@ from uuid import uuid4
 
 import uvicorn
 from pydantic import SecretStr
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, update
 from sqlalchemy.orm.decl_api import declarative_base
 from starlite import NotAuthorizedException, Starlite
 from starlite.middleware.session.memory_backend import MemoryBackendConfig
@@ -71,7 +71,9 @@ class UserService(BaseUserService[User, UserCreateDTO, UserUpdateDTO]):
     secret = SecretStr(ENCODING_SECRET)
 
     async def post_login_hook(self, user: User) -> None:  # This will properly increment the user's `login_count`
-        user.login_count += 1  # pyright: ignore
+        await self.repository.session.execute(
+            update(User).where(User.id == user.id).values(login_count=User.login_count + 1)  # type: ignore[arg-type]
+        )
         await self.repository.session.commit()
 
 
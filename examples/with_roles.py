@@ -4,7 +4,7 @@ from uuid import uuid4
 
 import uvicorn
 from pydantic import SecretStr
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String, update
 from sqlalchemy.orm.decl_api import declarative_base
 from starlite import Starlite
 from starlite.middleware.session.memory_backend import MemoryBackendConfig
@@ -105,7 +105,9 @@ class UserService(BaseUserRoleService[User, UserCreateDTO, UserUpdateDTO, Role])
     secret = SecretStr(ENCODING_SECRET)
 
     async def post_login_hook(self, user: User) -> None:  # This will properly increment the user's `login_count`
-        user.login_count += 1  # pyright: ignore
+        await self.repository.session.execute(
+            update(User).where(User.id == user.id).values(login_count=User.login_count + 1)  # type: ignore[arg-type]
+        )
         await self.repository.session.commit()
 
 
@@ -120,19 +122,21 @@ async def on_startup() -> None:
     async with sqlalchemy_config.engine.begin() as conn:  # pyright: ignore
         await conn.run_sync(Base.metadata.create_all)
 
-    admin_role = Role(name="administrator", description="Top admin")
+    # primary keys are set upfront so the association row can reference them within a single flush
+    admin_role = Role(id=uuid4(), name="administrator", description="Top admin")
     admin_user = User(
+        id=uuid4(),
         email="admin@example.com",
         password_hash=password_manager.get_hash(SecretStr("iamsuperadmin")),
         is_active=True,
         is_verified=True,
         title="Exemplar",
-        roles=[admin_role],
     )
+    admin_user_role = UserRole(user_id=admin_user.id, role_id=admin_role.id)
 
     async with sqlalchemy_config.session_maker() as session:
         async with session.begin():
-            session.add_all([admin_role, admin_user])
+            session.add_all([admin_role, admin_user, admin_user_role])
 
 
 starlite_users = StarliteUsers(
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, TypeVar, Union
+from typing import TYPE_CHECKING, FrozenSet, List, TypeVar, Union
 from uuid import UUID, uuid4
 
 from sqlalchemy import Boolean, Column, ForeignKey, String
@@ -38,10 +38,19 @@ class SQLAlchemyUserRoleMixin(SQLAlchemyUserMixin):
 
     @declared_attr  # type: ignore[misc]
     def roles(cls) -> "Mapped[List[RoleModelType]]":  # pylint: disable=E0213
-        """Roles attribute."""
+        """Roles attribute.
+
+        Eagerly loaded in the same `SELECT` as the user, so role checks never trigger lazy loads.
+        """
 
         return relationship("Role", secondary="user_roles", lazy="joined")  # type: ignore[misc]
 
+    @property
+    def role_ids(self) -> FrozenSet[UUID]:
+        """Ids of the user's roles, for comparing roles by id rather than by instance identity."""
+
+        return frozenset(role.id for role in self.roles)
+
 
 @declarative_mixin
 class SQLAlchemyRoleMixin:
@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict, Generic, Type, cast
+from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, Tuple, Type, cast
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import inspect, select, update
 from sqlalchemy.exc import IntegrityError, NoResultFound  # type: ignore[attr-defined]
+from sqlalchemy.orm import make_transient_to_detached
 from starlite.exceptions import ImproperlyConfiguredException
 
 from starlite_users.adapter.sqlalchemy.mixins import (
@@ -19,6 +21,9 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncSession
 
+_ROLE_CACHE: "TTLCache[Tuple[Any, ...], Dict[str, Any]]" = TTLCache(maxsize=1024, ttl=300)
+"""Column values of recently loaded roles, keyed by bound engine, role model and id or name."""
+
 
 class SQLAlchemyUserRepository(Generic[UserModelType]):  # TODO: create generic base for piccolo, tortoise etc
     """SQLAlchemy implementation of user persistence layer."""
@@ -57,6 +62,7 @@ class SQLAlchemyUserRepository(Generic[UserModelType]):  # TODO: create generic
 
             return user
         except IntegrityError as e:
+            await self.session.rollback()
             raise RepositoryConflictException from e
 
     async def get_user(self, id_: "UUID") -> UserModelType:
@@ -107,6 +113,26 @@ class SQLAlchemyUserRepository(Generic[UserModelType]):  # TODO: create generic
         user = await self.get_user(id_)
         return await self._update(user, data)
 
+    async def update_user_fields(self, id_: "UUID", data: Dict[str, Any]) -> None:
+        """Update user columns with a single `UPDATE` statement, without loading the user.
+
+        Args:
+            id_: UUID corresponding to a user primary key.
+            data: Dictionary to map to user columns and values.
+
+        Raises:
+            RepositoryNotFoundException: when no user matches the query.
+        """
+        result = await self.session.execute(
+            update(self.user_model)  # type: ignore[arg-type]
+            .where(self.user_model.id == id_)  # type: ignore[attr-defined]
+            .values(**data)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            raise RepositoryNotFoundException
+        await self.session.commit()
+
     async def delete_user(self, id_: "UUID") -> None:
         """Delete a user from the database.
 
@@ -165,6 +191,7 @@ class SQLAlchemyUserRoleRepository(
 
             return role
         except IntegrityError as e:
+            await self.session.rollback()
             raise RepositoryConflictException from e
 
     async def assign_role_to_user(self, user: UserRoleModelType, role: RoleModelType) -> UserRoleModelType:
@@ -200,9 +227,12 @@ class SQLAlchemyUserRoleRepository(
         """
         if self.role_model is None:
             raise ImproperlyConfiguredException("self.role_model is not configured")
+        cached_role = await self._get_cached_role(self._role_cache_key("id", id_))
+        if cached_role is not None:
+            return cached_role
         result = await self.session.execute(select(self.role_model).where(self.role_model.id == id_))  # type: ignore[arg-type]
         try:
-            return cast("RoleModelType", result.unique().scalar_one())
+            return self._cache_role(cast("RoleModelType", result.unique().scalar_one()))
         except NoResultFound as e:
             raise RepositoryNotFoundException from e
 
@@ -217,9 +247,12 @@ class SQLAlchemyUserRoleRepository(
         """
         if self.role_model is None:
             raise ImproperlyConfiguredException("self.role_model is not configured")
+        cached_role = await self._get_cached_role(self._role_cache_key("name", name))
+        if cached_role is not None:
+            return cached_role
         result = await self.session.execute(select(self.role_model).where(self.role_model.name == name))  # type: ignore[arg-type]
         try:
-            return cast("RoleModelType", result.unique().scalar_one())
+            return self._cache_role(cast("RoleModelType", result.unique().scalar_one()))
         except NoResultFound as e:
             raise RepositoryNotFoundException from e
 
@@ -231,10 +264,14 @@ class SQLAlchemyUserRoleRepository(
             data: Dictionary to map to role columns and values.
         """
         role = await self.get_role(id_)
+        # keys are taken before the rename, and dropped only once the commit has landed, so a concurrent read
+        # can't re-cache the old row while the commit is in flight
+        stale_keys = self._role_cache_keys(role)
         for attr, val in data.items():
             setattr(role, attr, val)
 
         await self.session.commit()
+        self._invalidate_cached_role(stale_keys)
         return role
 
     async def delete_role(self, id_: "UUID") -> None:
@@ -243,6 +280,34 @@ class SQLAlchemyUserRoleRepository(
         Args:
             id_: UUID corresponding to a role primary key.
         """
-        role = await self.get_user(id_)
+        role = await self.get_role(id_)
+        stale_keys = self._role_cache_keys(role)
         await self.session.delete(role)
         await self.session.commit()
+        self._invalidate_cached_role(stale_keys)
+
+    async def _get_cached_role(self, key: Tuple[Any, ...]) -> Optional[RoleModelType]:
+        values = _ROLE_CACHE.get(key)
+        if values is None:
+            return None
+        # attach a fresh copy to this session without emitting a `SELECT`
+        role = self.role_model(**values)
+        make_transient_to_detached(role)
+        return cast("RoleModelType", await self.session.merge(role, load=False))
+
+    def _cache_role(self, role: RoleModelType) -> RoleModelType:
+        values = {attr.key: getattr(role, attr.key) for attr in inspect(role).mapper.column_attrs}
+        for key in self._role_cache_keys(role):
+            _ROLE_CACHE[key] = values
+        return role
+
+    def _invalidate_cached_role(self, keys: Tuple[Tuple[Any, ...], ...]) -> None:
+        for key in keys:
+            _ROLE_CACHE.pop(key, None)
+
+    def _role_cache_keys(self, role: RoleModelType) -> Tuple[Tuple[Any, ...], ...]:
+        return self._role_cache_key("id", role.id), self._role_cache_key("name", role.name)
+
+    def _role_cache_key(self, field: str, value: Any) -> Tuple[Any, ...]:
+        # the engine is part of the key so apps, or recreated databases, in one process never share entries
+        return (self.session.get_bind(mapper=self.role_model), self.role_model, field, value)
@@ -1,3 +1,8 @@
+import os
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from secrets import token_hex
 from typing import TYPE_CHECKING, Optional, Tuple, cast
 
 from passlib.context import CryptContext
@@ -6,13 +11,30 @@ if TYPE_CHECKING:
     from pydantic import SecretStr
 
 
+_HASHING_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hashing")
+"""Bounds concurrent hashes, and their memory cost, to one per core, apart from the loop's default executor."""
+
+
 class PasswordManager:
-    """Thin wrapper around `passlib`."""
+    """Thin wrapper around `passlib`, hashing with Argon2id."""
 
     def __init__(self) -> None:
         """Construct a PasswordManager."""
 
-        self.context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # new hashes use Argon2id; existing bcrypt hashes still verify and are upgraded via `verify_and_update`
+        self.context = CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated="auto",
+            argon2__type="ID",
+            argon2__memory_cost=65536,
+            argon2__time_cost=3,
+            argon2__parallelism=4,
+        )
+
+    @cached_property
+    def dummy_hash(self) -> str:
+        """Return a hash of a random password, for equalising verification time when no user matches."""
+        return cast("str", self.context.hash(token_hex(16)))
 
     def get_hash(self, password: "SecretStr") -> str:
         """Create a password hash.
@@ -32,3 +54,40 @@ class PasswordManager:
         return cast(
             "Tuple[bool, Optional[str]]", self.context.verify_and_update(password.get_secret_value(), password_hash)
         )
+
+    def verify_dummy(self, password: "SecretStr") -> None:
+        """Verify a password against `dummy_hash`, taking as long as a real verification.
+
+        Args:
+            password: The password that was submitted.
+        """
+        self.context.verify(password.get_secret_value(), self.dummy_hash)
+
+    async def get_hash_async(self, password: "SecretStr") -> str:
+        """Create a password hash in a worker thread, without blocking the event loop.
+
+        Args:
+            password: The password to hash.
+        """
+        return await get_running_loop().run_in_executor(_HASHING_EXECUTOR, self.get_hash, password)
+
+    async def verify_and_update_async(self, password: "SecretStr", password_hash: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if the hash is deprecated, in a worker thread.
+
+        Args:
+            password: The password to verify.
+            password_hash: The hash to verify against.
+        """
+        return await get_running_loop().run_in_executor(
+            _HASHING_EXECUTOR, self.verify_and_update, password, password_hash
+        )
+
+    async def verify_dummy_async(self, password: "SecretStr") -> None:
+        """Verify a password against `dummy_hash` in a worker thread.
+
+        `dummy_hash` is created on first use, so it is also computed off the event loop.
+
+        Args:
+            password: The password that was submitted.
+        """
+        await get_running_loop().run_in_executor(_HASHING_EXECUTOR, self.verify_dummy, password)
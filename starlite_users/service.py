@@ -1,8 +1,14 @@
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Generic, Optional, Type, TypeVar
-
-from jose import JWTError
-from pydantic import SecretStr
+import hashlib
+import hmac
+from base64 import urlsafe_b64encode
+from datetime import timedelta
+from time import time
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generic, Optional, Type, TypeVar
+
+import orjson
+from cachetools import TTLCache
+from jose.utils import base64url_decode
+from pydantic import SecretStr, ValidationError
 from starlite.contrib.jwt.jwt_token import Token
 from starlite.exceptions import ImproperlyConfiguredException
 
@@ -32,6 +38,15 @@ from starlite_users.schema import (
 if TYPE_CHECKING:
     from uuid import UUID
 
+_PASSWORD_EXCLUDE = frozenset({"password"})
+"""DTO fields that must never be copied onto a user model as-is."""
+_TOKEN_LIFETIME = int(timedelta(days=1).total_seconds())  # TODO: make time configurable?
+"""Validity period of verification and password reset tokens, in seconds."""
+_JWT_HEADER = urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+"""Encoded JOSE header shared by every token this service signs."""
+_TOKEN_CACHE: "TTLCache[bytes, Token]" = TTLCache(maxsize=10000, ttl=30)
+"""Recently decoded tokens, keyed by a SHA-256 digest of the secret, audience and encoded token."""
+
 
 class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOType]):  # pylint: disable=R0904
     """Main user management interface."""
@@ -40,6 +55,8 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
     """A subclass of a `User` ORM model."""
     secret: SecretStr
     """Secret string for securely signing tokens."""
+    password_manager: ClassVar[PasswordManager] = PasswordManager()
+    """Password hasher, shared by all service instances."""
 
     def __init__(self, repository: "SQLAlchemyUserRepository[UserModelType]") -> None:
         """User service constructor.
@@ -48,7 +65,8 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
             repository: A `UserRepository` instance
         """
         self.repository = repository
-        self.password_manager = PasswordManager()
+        self._secret_value = self.secret.get_secret_value()
+        self._secret_bytes = self._secret_value.encode()
 
     async def add_user(self, data: UserCreateDTOType, process_unsafe_fields: bool = False) -> UserModelType:
         """Create a new user programmatically.
@@ -56,16 +74,12 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
         Args:
             data: User creation data transfer object.
             process_unsafe_fields: If True, set `is_active` and `is_verified` attributes as they appear in `data`, otherwise always set their defaults.
-        """
-        try:
-            existing_user = await self.get_user_by(email=data.email)
-            if existing_user:
-                raise RepositoryConflictException("email already associated with an account")
-        except RepositoryNotFoundException:
-            pass
 
-        user_dict = data.dict(exclude={"password"})
-        user_dict["password_hash"] = self.password_manager.get_hash(data.password)
+        Raises:
+            RepositoryConflictException: If the email is already associated with an account.
+        """
+        user_dict = data.dict(exclude=_PASSWORD_EXCLUDE)
+        user_dict["password_hash"] = await self.password_manager.get_hash_async(data.password)
         if not process_unsafe_fields:
             user_dict["is_verified"] = False
             user_dict["is_active"] = True
@@ -117,9 +131,9 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
             id_: UUID corresponding to a user primary key.
             data: User update data transfer object.
         """
-        update_dict = data.dict(exclude={"password"}, exclude_unset=True)
+        update_dict = data.dict(exclude=_PASSWORD_EXCLUDE, exclude_unset=True)
         if data.password:
-            update_dict["password_hash"] = self.password_manager.get_hash(data.password)
+            update_dict["password_hash"] = await self.password_manager.get_hash_async(data.password)
 
         return await self.repository.update_user(id_, update_dict)
 
@@ -140,9 +154,16 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
         if not await self.pre_login_hook(data):
             return None
 
-        user = await self.repository.get_user_by(email=data.email)
+        try:
+            user = await self.repository.get_user_by(email=data.email)
+        except RepositoryNotFoundException:
+            # hash anyway, so response time doesn't reveal whether the email is registered
+            await self.password_manager.verify_dummy_async(data.password)
+            return None
 
-        verified, new_password_hash = self.password_manager.verify_and_update(data.password, user.password_hash)
+        verified, new_password_hash = await self.password_manager.verify_and_update_async(
+            data.password, user.password_hash
+        )
         if not verified:
             return None
         if new_password_hash is not None:
@@ -159,12 +180,15 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
             user_id: UUID of the user to provide the token to.
             aud: Context of the token
         """
-        token = Token(
-            exp=datetime.now() + timedelta(seconds=60 * 60 * 24),  # TODO: make time configurable?
-            sub=str(user_id),
-            aud=aud,
+        now = int(time())
+        return self._encode_hs256(
+            {
+                "exp": now + _TOKEN_LIFETIME,
+                "iat": now,
+                "sub": str(user_id),
+                "aud": aud,
+            }
         )
-        return token.encode(secret=self.secret.get_secret_value(), algorithm="HS256")
 
     async def initiate_verification(self, user: UserModelType) -> None:
         """Initiate the user verification flow.
@@ -244,8 +268,9 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
         token = self._decode_and_verify_token(encoded_token, context="reset_password")
 
         user_id = token.sub
+        password_hash = await self.password_manager.get_hash_async(password)
         try:
-            await self.repository.update_user(user_id, {"password_hash": self.password_manager.get_hash(password)})
+            await self.repository.update_user_fields(user_id, {"password_hash": password_hash})
         except RepositoryNotFoundException as e:
             raise InvalidTokenException from e
 
@@ -330,18 +355,46 @@ class BaseUserService(Generic[UserModelType, UserCreateDTOType, UserUpdateDTOTyp
         code while successfully validating the user.
         """
 
-    def _decode_and_verify_token(self, encoded_token: str, context: str) -> Token:
+    def _encode_hs256(self, payload: Dict[str, Any]) -> str:
+        signing_input = _JWT_HEADER + b"." + urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=")
+        signature = hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + urlsafe_b64encode(signature).rstrip(b"=")).decode()
+
+    def _decode_hs256(self, encoded_token: str, audience: str) -> Token:
         try:
-            token = Token.decode(
-                encoded_token=encoded_token,
-                secret=self.secret.get_secret_value(),
-                algorithm="HS256",
-            )
-        except JWTError as e:
+            signing_input, _, encoded_signature = encoded_token.encode().rpartition(b".")
+            encoded_header, _, encoded_payload = signing_input.partition(b".")
+            header = orjson.loads(base64url_decode(encoded_header))
+            signature = base64url_decode(encoded_signature)
+        except ValueError as e:
+            raise InvalidTokenException("malformed token") from e
+
+        if not isinstance(header, dict) or header.get("alg") != "HS256":
+            raise InvalidTokenException("alg value must be HS256")
+        if not hmac.compare_digest(signature, hmac.new(self._secret_bytes, signing_input, hashlib.sha256).digest()):
+            raise InvalidTokenException("signature verification failed")
+
+        try:
+            payload = orjson.loads(base64url_decode(encoded_payload))
+            if not isinstance(payload, dict):
+                raise InvalidTokenException("malformed token")
+            if payload.get("aud") != audience:
+                raise InvalidTokenException(f"aud value must be {audience}")
+            return Token(**payload)
+        except (ValueError, ValidationError) as e:
             raise InvalidTokenException from e
 
-        if token.aud != context:
-            raise InvalidTokenException(f"aud value must be {context}")
+    def _decode_and_verify_token(self, encoded_token: str, context: str) -> Token:
+        secret = self._secret_value
+        # never store the raw token; the secret and context are included so a hit implies both were checked
+        cache_key = hashlib.sha256(f"{secret}:{context}:{encoded_token}".encode()).digest()
+
+        token = _TOKEN_CACHE.get(cache_key)
+        if token is None:
+            token = self._decode_hs256(encoded_token, audience=context)
+            _TOKEN_CACHE[cache_key] = token
+        elif token.exp.timestamp() <= time():
+            raise InvalidTokenException("token has expired")
 
         return token
 
@@ -361,8 +414,7 @@ class BaseUserRoleService(
         Args:
             repository: A `UserRepository` instance
         """
-        self.repository = repository
-        self.password_manager = PasswordManager()
+        super().__init__(repository)
 
     async def get_role(self, id_: "UUID") -> RoleModelType:
         """Retrieve a role by id.
@@ -414,9 +466,9 @@ class BaseUserRoleService(
         """
         user = await self.get_user(user_id)
         role = await self.get_role(role_id)
-        if not hasattr(user, "roles"):
-            raise ImproperlyConfiguredException("'User' model has no roles attribute")
-        if isinstance(user.roles, list) and role in user.roles:
+        if not hasattr(user, "role_ids"):
+            raise ImproperlyConfiguredException("'User' model has no role_ids attribute")
+        if role.id in user.role_ids:
             raise RepositoryConflictException(f"user already has role '{role.name}'")
         return await self.repository.assign_role_to_user(user, role)
 
@@ -429,9 +481,9 @@ class BaseUserRoleService(
         """
         user = await self.get_user(user_id)
         role = await self.get_role(role_id)
-        if not hasattr(user, "roles"):
-            raise ImproperlyConfiguredException("'User' model has no roles attribute")
-        if isinstance(user.roles, list) and role not in user.roles:
+        if not hasattr(user, "role_ids"):
+            raise ImproperlyConfiguredException("'User' model has no role_ids attribute")
+        if role.id not in user.role_ids:
             raise RepositoryConflictException(f"user does not have role '{role.name}'")
         return await self.repository.revoke_role_from_user(user, role)
 
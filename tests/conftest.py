@@ -1,11 +1,12 @@
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Awaitable, Callable, Generator, List, cast
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
 from pydantic import SecretStr
-from sqlalchemy import Column
+from sqlalchemy import Column, MetaData
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm.decl_api import declarative_base
 from starlite import Starlite
 from starlite.contrib.jwt.jwt_token import Token
@@ -16,6 +17,7 @@ from starlite.testing import TestClient
 from starlite_users import StarliteUsers, StarliteUsersConfig
 from starlite_users.adapter.sqlalchemy.guid import GUID
 from starlite_users.adapter.sqlalchemy.mixins import SQLAlchemyUserMixin
+from starlite_users.adapter.sqlalchemy.repository import _ROLE_CACHE
 from starlite_users.config import (
     AuthHandlerConfig,
     CurrentUserHandlerConfig,
@@ -26,13 +28,13 @@ from starlite_users.config import (
 )
 from starlite_users.password import PasswordManager
 from starlite_users.schema import BaseUserCreateDTO, BaseUserReadDTO, BaseUserUpdateDTO
-from starlite_users.service import BaseUserService
+from starlite_users.service import _TOKEN_CACHE, BaseUserService
 
 from .constants import ENCODING_SECRET
 from .utils import MockAuth, MockSQLAlchemyUserRepository, basic_guard
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
 
 
 class _Base:
@@ -189,6 +191,68 @@ def _patch_sqlalchemy_plugin_config() -> "Iterator":
     monkeypatch.undo()
 
 
+@pytest.fixture()
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture()
+def metadata() -> MetaData:
+    return cast("MetaData", Base.metadata)
+
+
+@pytest.fixture()
+async def engine_factory(metadata: MetaData) -> "AsyncIterator[Callable[[], Awaitable[AsyncEngine]]]":
+    engines: List[AsyncEngine] = []
+
+    async def create_engine() -> AsyncEngine:
+        engine = create_async_engine("sqlite+aiosqlite:///")
+        engines.append(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+        return engine
+
+    yield create_engine
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture()
+async def engine(engine_factory: Callable[[], Awaitable[AsyncEngine]]) -> AsyncEngine:
+    return await engine_factory()
+
+
+@pytest.fixture()
+async def session_factory(
+    engine_factory: Callable[[], Awaitable[AsyncEngine]]
+) -> "AsyncIterator[Callable[[AsyncEngine], AsyncSession]]":
+    # requesting `engine_factory` makes sessions close before their engines are disposed
+    sessions: List[AsyncSession] = []
+
+    def open_session(engine: AsyncEngine) -> AsyncSession:
+        session = AsyncSession(engine, expire_on_commit=False)
+        sessions.append(session)
+        return session
+
+    yield open_session
+    for session in sessions:
+        await session.close()
+
+
+@pytest.fixture()
+def session(engine: AsyncEngine, session_factory: Callable[[AsyncEngine], AsyncSession]) -> AsyncSession:
+    return session_factory(engine)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> "Iterator":
+    _TOKEN_CACHE.clear()
+    _ROLE_CACHE.clear()
+    yield
+    _TOKEN_CACHE.clear()
+    _ROLE_CACHE.clear()
+
+
 @pytest.fixture()
 def mock_user_repository(
     admin_user: User,
@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+from pydantic import SecretStr
+
+from starlite_users.password import PasswordManager
+
+
+def test_get_hash_uses_argon2id() -> None:
+    password_hash = PasswordManager().get_hash(SecretStr("justauser"))
+    assert password_hash.startswith("$argon2id$v=19$m=65536,t=3,p=4$")
+
+
+def test_verify_and_update_rehashes_bcrypt() -> None:
+    password_manager = PasswordManager()
+    bcrypt_hash = password_manager.context.handler("bcrypt").hash("justauser")
+
+    verified, new_hash = password_manager.verify_and_update(SecretStr("justauser"), bcrypt_hash)
+    assert verified
+    assert new_hash is not None
+    assert new_hash.startswith("$argon2id$")
+    assert password_manager.verify_and_update(SecretStr("justauser"), new_hash) == (True, None)
+    assert password_manager.verify_and_update(SecretStr("wrong"), bcrypt_hash) == (False, None)
+
+
+@pytest.mark.anyio
+async def test_verify_dummy_async_hashes_off_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    password_manager = PasswordManager()
+    hashing_threads = []
+    context_hash = password_manager.context.hash
+
+    def record_thread(secret: str) -> str:
+        hashing_threads.append(threading.current_thread())
+        return context_hash(secret)  # type: ignore[no-any-return]
+
+    monkeypatch.setattr(password_manager.context, "hash", record_thread)
+    await password_manager.verify_dummy_async(SecretStr("nobody"))
+
+    assert hashing_threads
+    assert threading.current_thread() not in hashing_threads
+    assert "dummy_hash" in password_manager.__dict__
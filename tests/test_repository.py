@@ -0,0 +1,30 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from starlite_users.adapter.sqlalchemy.repository import SQLAlchemyUserRepository
+from starlite_users.exceptions import RepositoryNotFoundException
+
+from .conftest import User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture()
+def repository(session: AsyncSession) -> SQLAlchemyUserRepository[User]:
+    return SQLAlchemyUserRepository(session=session, user_model_type=User)
+
+
+async def test_update_user_fields(repository: SQLAlchemyUserRepository[User], session: AsyncSession) -> None:
+    user = await repository.add_user(User(email="someone@example.com", password_hash="x", is_active=True))
+
+    await repository.update_user_fields(user.id, {"password_hash": "y"})
+
+    session.expunge_all()
+    assert (await repository.get_user(user.id)).password_hash == "y"
+
+
+async def test_update_user_fields_not_found(repository: SQLAlchemyUserRepository[User]) -> None:
+    with pytest.raises(RepositoryNotFoundException):
+        await repository.update_user_fields(uuid4(), {"password_hash": "y"})
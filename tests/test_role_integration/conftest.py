@@ -1,7 +1,9 @@
+from typing import cast
 from uuid import UUID
 
 import pytest
 from pydantic import SecretStr
+from sqlalchemy import MetaData
 from sqlalchemy.orm.decl_api import declarative_base
 from starlite.middleware.session.memory_backend import MemoryBackendConfig
 
@@ -45,6 +47,11 @@ class UserService(BaseUserRoleService[User, UserCreateDTO, UserUpdateDTO, Role])
     secret = ENCODING_SECRET
 
 
+@pytest.fixture()
+def metadata() -> MetaData:
+    return cast("MetaData", Base.metadata)
+
+
 @pytest.fixture()
 def admin_role() -> Role:
     return Role(
@@ -0,0 +1,125 @@
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from starlite_users.adapter.sqlalchemy.repository import SQLAlchemyUserRoleRepository
+from starlite_users.exceptions import RepositoryNotFoundException
+
+from .conftest import Role, User
+
+pytestmark = pytest.mark.anyio
+
+RepositoryFactory = Callable[[AsyncEngine], SQLAlchemyUserRoleRepository[User, Role]]
+
+
+@pytest.fixture()
+def statements(engine: AsyncEngine) -> List[str]:
+    statements: List[str] = []
+    event.listen(  # type: ignore[no-untyped-call]
+        engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    return statements
+
+
+@pytest.fixture()
+def get_repository(session_factory: Callable[[AsyncEngine], AsyncSession]) -> RepositoryFactory:
+    def get_repository(engine: AsyncEngine) -> SQLAlchemyUserRoleRepository[User, Role]:
+        return SQLAlchemyUserRoleRepository(session=session_factory(engine), user_model_type=User, role_model_type=Role)
+
+    return get_repository
+
+
+async def test_get_role_cache_hit(
+    engine: AsyncEngine, get_repository: RepositoryFactory, statements: List[str]
+) -> None:
+    role = await get_repository(engine).add_role(Role(name="writer", description="X"))
+    await get_repository(engine).get_role(role.id)
+    statements.clear()
+
+    repository = get_repository(engine)
+    cached_role = await repository.get_role(role.id)
+    assert cached_role.name == "writer"
+    assert cached_role in repository.session
+    assert (await repository.get_role_by_name("writer")) is cached_role
+    assert not [statement for statement in statements if statement.startswith("SELECT")]
+
+    user = await repository.add_user(User(email="someone@example.com", password_hash="x"))
+    await repository.assign_role_to_user(user, cached_role)
+    repository.session.expunge_all()
+    assert (await repository.get_user(user.id)).role_ids == {role.id}
+
+
+async def test_update_role_invalidates_cache(engine: AsyncEngine, get_repository: RepositoryFactory) -> None:
+    role = await get_repository(engine).add_role(Role(name="writer", description="X"))
+    await get_repository(engine).get_role_by_name("writer")
+
+    await get_repository(engine).update_role(role.id, {"name": "editor"})
+
+    repository = get_repository(engine)
+    assert (await repository.get_role(role.id)).name == "editor"
+    assert (await repository.get_role_by_name("editor")).id == role.id
+    with pytest.raises(RepositoryNotFoundException):
+        await repository.get_role_by_name("writer")
+
+
+async def test_delete_role_invalidates_cache(engine: AsyncEngine, get_repository: RepositoryFactory) -> None:
+    role = await get_repository(engine).add_role(Role(name="writer", description="X"))
+    await get_repository(engine).get_role(role.id)
+
+    await get_repository(engine).delete_role(role.id)
+
+    repository = get_repository(engine)
+    with pytest.raises(RepositoryNotFoundException):
+        await repository.get_role(role.id)
+    with pytest.raises(RepositoryNotFoundException):
+        await repository.get_role_by_name("writer")
+
+
+async def test_role_cache_is_per_engine(
+    engine: AsyncEngine,
+    engine_factory: Callable[[], Awaitable[AsyncEngine]],
+    get_repository: RepositoryFactory,
+) -> None:
+    other_engine = await engine_factory()
+    role = await get_repository(engine).add_role(Role(name="administrator", description="X"))
+    other_role = await get_repository(other_engine).add_role(Role(name="administrator", description="X"))
+    assert role.id != other_role.id
+
+    assert (await get_repository(engine).get_role_by_name("administrator")).id == role.id
+    assert (await get_repository(other_engine).get_role_by_name("administrator")).id == other_role.id
+    with pytest.raises(RepositoryNotFoundException):
+        await get_repository(other_engine).get_role(role.id)
+
+
+async def test_get_role_not_found(engine: AsyncEngine, get_repository: RepositoryFactory) -> None:
+    with pytest.raises(RepositoryNotFoundException):
+        await get_repository(engine).get_role(uuid4())
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(lambda repository, id_: repository.update_role(id_, {"name": "editor"}), id="update"),
+        pytest.param(lambda repository, id_: repository.delete_role(id_), id="delete"),
+    ],
+)
+async def test_role_cache_invalidated_after_commit(
+    engine: AsyncEngine, get_repository: RepositoryFactory, monkeypatch: pytest.MonkeyPatch, change: Callable
+) -> None:
+    role = await get_repository(engine).add_role(Role(name="writer", description="X"))
+    repository = get_repository(engine)
+    commit = repository.session.commit
+
+    async def commit_after_concurrent_read() -> None:
+        # another request reads, and caches, the old row while this commit is in flight
+        await get_repository(engine).get_role_by_name("writer")
+        await commit()
+
+    monkeypatch.setattr(repository.session, "commit", commit_after_concurrent_read)
+    await change(repository, role.id)
+
+    with pytest.raises(RepositoryNotFoundException):
+        await get_repository(engine).get_role_by_name("writer")
@@ -1,12 +1,16 @@
+from datetime import datetime, timedelta
 from unittest.mock import ANY
+from uuid import uuid4
 
 import pytest
 from pydantic import SecretStr
+from starlite.contrib.jwt.jwt_token import Token
 from starlite.testing import TestClient
 
 from starlite_users import StarliteUsersConfig
 
 from .conftest import User, password_manager
+from .constants import ENCODING_SECRET
 from .utils import MockAuth
 
 
@@ -18,6 +22,9 @@ def test_login(client: TestClient) -> None:
     fail_response = client.post("/login", json={"email": "admin@example.com", "password": "ijustguessed"})
     assert fail_response.status_code == 401
 
+    unknown_response = client.post("/login", json={"email": "nobody@example.com", "password": "ijustguessed"})
+    assert unknown_response.status_code == 401
+
 
 @pytest.mark.usefixtures("mock_user_repository")
 def test_logout(client: TestClient, generic_user: User, starlite_users_config: StarliteUsersConfig) -> None:
@@ -107,3 +114,16 @@ def test_reset_password(client: TestClient, generic_user: User, generic_user_pas
     )
     assert response.status_code == 201
     assert password_manager.verify_and_update(SecretStr(PASSWORD), generic_user.password_hash)[0] is True
+
+
+@pytest.mark.usefixtures("mock_user_repository")
+def test_reset_password_unknown_user(client: TestClient) -> None:
+    token = Token(exp=datetime.now() + timedelta(days=1), sub=str(uuid4()), aud="reset_password")
+    response = client.post(
+        "/reset-password",
+        json={
+            "token": token.encode(secret=ENCODING_SECRET.get_secret_value(), algorithm="HS256"),
+            "password": "veryverystrong123",
+        },
+    )
+    assert response.status_code == 400
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from starlite.contrib.jwt.jwt_token import Token
+
+from starlite_users.exceptions import InvalidTokenException
+from starlite_users.service import _TOKEN_CACHE
+
+from .conftest import UserService
+from .constants import ENCODING_SECRET
+from .utils import MockSQLAlchemyUserRepository
+
+USER_ID = UUID("555d9ddb-7033-4819-a983-e817237b88e5")
+
+
+@pytest.fixture()
+def service() -> UserService:
+    return UserService(MockSQLAlchemyUserRepository())  # type: ignore[arg-type]
+
+
+def test_generate_token(service: UserService) -> None:
+    encoded_token = service.generate_token(USER_ID, aud="verify")
+    token = Token.decode(encoded_token=encoded_token, secret=ENCODING_SECRET.get_secret_value(), algorithm="HS256")
+    assert token.sub == str(USER_ID)
+    assert token.aud == "verify"
+
+
+def test_decode_and_verify_token_context(service: UserService) -> None:
+    encoded_token = service.generate_token(USER_ID, aud="verify")
+    assert service._decode_and_verify_token(encoded_token, context="verify").sub == str(USER_ID)
+    assert len(_TOKEN_CACHE) == 1
+    with pytest.raises(InvalidTokenException):
+        service._decode_and_verify_token(encoded_token, context="reset_password")
+
+
+def test_decode_and_verify_token_cached(service: UserService, monkeypatch: pytest.MonkeyPatch) -> None:
+    encoded_token = service.generate_token(USER_ID, aud="verify")
+    token = service._decode_and_verify_token(encoded_token, context="verify")
+
+    decode = MagicMock(side_effect=AssertionError("token should be served from the cache"))
+    monkeypatch.setattr(service, "_decode_hs256", decode)
+    assert service._decode_and_verify_token(encoded_token, context="verify") is token
+    decode.assert_not_called()
+
+
+def test_decode_and_verify_token_cached_expired(service: UserService, monkeypatch: pytest.MonkeyPatch) -> None:
+    encoded_token = service.generate_token(USER_ID, aud="verify")
+    token = service._decode_and_verify_token(encoded_token, context="verify")
+
+    monkeypatch.setattr("starlite_users.service.time", lambda: token.exp.timestamp() + 1)
+    with pytest.raises(InvalidTokenException):
+        service._decode_and_verify_token(encoded_token, context="verify")
+
+
+@pytest.mark.parametrize(
+    "encoded_token",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("not.a.token", id="garbage"),
+        pytest.param(
+            Token(exp=datetime.now() + timedelta(days=1), sub=str(USER_ID), aud="verify").encode(
+                secret="someothersecret", algorithm="HS256"
+            ),
+            id="wrong-secret",
+        ),
+        pytest.param(
+            Token(exp=datetime.now() + timedelta(days=1), sub=str(USER_ID), aud="verify").encode(
+                secret=ENCODING_SECRET.get_secret_value(), algorithm="HS512"
+            ),
+            id="wrong-alg",
+        ),
+    ],
+)
+def test_decode_and_verify_token_invalid(service: UserService, encoded_token: str) -> None:
+    with pytest.raises(InvalidTokenException):
+        service._decode_and_verify_token(encoded_token, context="verify")
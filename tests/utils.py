@@ -10,7 +10,10 @@ from starlite_users.adapter.sqlalchemy.mixins import (
     UserModelType,
     UserRoleModelType,
 )
-from starlite_users.exceptions import RepositoryNotFoundException
+from starlite_users.exceptions import (
+    RepositoryConflictException,
+    RepositoryNotFoundException,
+)
 
 from .constants import ENCODING_SECRET
 
@@ -55,6 +58,8 @@ class MockSQLAlchemyUserRepository(Generic[UserModelType]):
         pass
 
     async def add_user(self, data: UserModelType) -> UserModelType:
+        if any(user.email == data.email for user in self.user_store.values()):
+            raise RepositoryConflictException()
         data.id = str(uuid4())
         self.user_store[data.id] = data
         return data
@@ -65,11 +70,11 @@ class MockSQLAlchemyUserRepository(Generic[UserModelType]):
             raise RepositoryNotFoundException()
         return result
 
-    async def get_user_by(self, **kwargs: Any) -> Optional[UserModelType]:
+    async def get_user_by(self, **kwargs: Any) -> UserModelType:
         for user in self.user_store.values():
             if all([getattr(user, key) == kwargs[key] for key in kwargs.keys()]):
                 return user
-        return None
+        raise RepositoryNotFoundException()
 
     async def update_user(self, id_: "UUID", data: Dict[str, Any]) -> UserModelType:
         result = await self.get_user(id_)
@@ -77,6 +82,9 @@ class MockSQLAlchemyUserRepository(Generic[UserModelType]):
             setattr(result, k, v)
         return result
 
+    async def update_user_fields(self, id_: "UUID", data: Dict[str, Any]) -> None:
+        await self.update_user(id_, data)
+
     async def delete_user(self, id_: "UUID") -> None:
         self.user_store.pop(str(id_))
 